@@ -15,10 +15,11 @@ from typing import Optional, Sequence, Type, Union
 
 import eth_abi
 from eth_abi import decode
-from eth_typing import HexAddress
+from eth_typing import HexAddress, HexStr
+from eth_utils import encode_hex, function_signature_to_4byte_selector
 from hexbytes import HexBytes
 from web3 import Web3
-from web3._utils.abi import get_abi_input_names, get_abi_input_types
+from web3._utils.abi import get_abi_input_names, get_abi_input_types, abi_to_signature, merge_args_and_kwargs, get_aligned_abi_inputs
 from web3._utils.contracts import encode_abi, get_function_info
 from web3.contract.contract import Contract, ContractFunction
 
@@ -287,6 +288,27 @@ def encode_function_args(func: ContractFunction, args: Sequence) -> bytes:
     return encoded_args
 
 
+@lru_cache(maxsize=_CACHE_SIZE)
+def get_function_selector(function_signature: str) -> HexStr:
+    """Get the 4 bytes function selector for a Solidity function signature.
+
+    Any results are cached, so we do not recompute Keccak hash for the same functions.
+
+    Example:
+
+    .. code-block:: python
+
+        assert get_function_selector("approve(address,uint256)") == "0x095ea7b3"
+
+    :param function_signature:
+        Solidity function signature like `approve(address,uint256)`
+
+    :return:
+        Function selector as a hex string
+    """
+    return encode_hex(function_signature_to_4byte_selector(function_signature))
+
+
 def encode_function_call(
     func: ContractFunction,
     args: Sequence,
@@ -308,17 +330,23 @@ def encode_function_call(
 
     """
     w3 = func.w3
-    contract_abi = func.contract_abi
     fn_abi = func.abi
-    fn_identifier = func.function_identifier
-    fn_abi, fn_selector, fn_arguments = get_function_info(
-        # type ignored b/c fn_id here is always str b/c FallbackFn is handled above
-        fn_identifier,  # type: ignore
-        w3.codec,
-        contract_abi,
-        fn_abi,
-        args,
-    )
+
+    if fn_abi is not None:
+        # Bound function, use cached selector
+        fn_selector = get_function_selector(abi_to_signature(fn_abi))
+        fn_arguments = merge_args_and_kwargs(fn_abi, args, {})
+        _, fn_arguments = get_aligned_abi_inputs(fn_abi, fn_arguments)
+    else:
+        fn_abi, fn_selector, fn_arguments = get_function_info(
+            # type ignored b/c fn_id here is always str b/c FallbackFn is handled above
+            func.function_identifier,  # type: ignore
+            w3.codec,
+            func.contract_abi,
+            fn_abi,
+            args,
+        )
+
     encoded = encode_abi(w3, fn_abi, fn_arguments, fn_selector)
     return HexBytes(encoded)
 
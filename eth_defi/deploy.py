@@ -3,19 +3,23 @@
 `See Github for available contracts <https://github.com/tradingstrategy-ai/web3-ethereum-defi/tree/master/eth_defi/abi>`_.
 """
 
-from typing import Union, TypeAlias, Dict
+from typing import Union, TypeAlias, Dict, TYPE_CHECKING
 
 from eth_typing import HexAddress
-from web3 import Web3
-from web3.contract import Contract
 
-from eth_defi.abi import get_contract
+if TYPE_CHECKING:
+    # web3 and ABI machinery is heavy to import,
+    # so we import them only when deploying
+    from web3 import Web3
+    from web3.contract import Contract
 
 
 #: Manage internal registry of deployed contracts
 #:
-#: Lower case address -> Contract mapping.
-ContractRegistry: TypeAlias = Dict[str, Contract]
+#: Raw 20 bytes address -> Contract mapping.
+#:
+#: See :py:func:`get_registry_key`.
+ContractRegistry: TypeAlias = Dict[bytes, "Contract"]
 
 
 class ContractDeploymentFailed(Exception):
@@ -27,12 +31,12 @@ class ContractDeploymentFailed(Exception):
 
 
 def deploy_contract(
-    web3: Web3,
-    contract: Union[str, Contract],
+    web3: "Web3",
+    contract: Union[str, "Contract"],
     deployer: str,
     *constructor_args,
     register_for_tracing=True,
-) -> Contract:
+) -> "Contract":
     """Deploys a new contract from ABI file.
 
     A generic helper function to deploy any contract.
@@ -48,7 +52,10 @@ def deploy_contract(
         Web3 instance
 
     :param contract:
-        Contract file path as string or contract proxy class
+        Contract file path as string or contract proxy class.
+
+        Contract proxy classes created from files are cached,
+        see :py:func:`eth_defi.abi.get_contract`.
 
     :param deployer:
         Deployer account
@@ -69,6 +76,8 @@ def deploy_contract(
 
     """
     if isinstance(contract, str):
+        from eth_defi.abi import get_contract
+
         Contract = get_contract(web3, contract)
 
         # Used in trace.py
@@ -95,7 +104,7 @@ def deploy_contract(
     return instance
 
 
-def get_or_create_contract_registry(web3: Web3) -> ContractRegistry:
+def get_or_create_contract_registry(web3: "Web3") -> ContractRegistry:
     """Get a contract registry associated with a Web3 connection.
 
     - Only relevant for test sessions
@@ -116,17 +125,37 @@ def get_or_create_contract_registry(web3: Web3) -> ContractRegistry:
     return web3.contract_registry
 
 
-def register_contract(web3, address: HexAddress, instance: Contract):
+def get_registry_key(address: HexAddress | str | bytes) -> bytes:
+    """Get the contract registry key for an address.
+
+    Hex strings are converted to raw bytes, so any checksum or lower case
+    variant of the address maps to the same key.
+
+    :param address:
+        Address as a 0x prefixed hex string or raw bytes
+
+    :return:
+        20 bytes address
+    """
+    if isinstance(address, str):
+        assert address.startswith("0x"), f"Address is not 0x prefixed: {address}"
+        key = bytes.fromhex(address[2:])
+    else:
+        key = bytes(address)
+    assert len(key) == 20, f"Bad address: {address}"
+    return key
+
+
+def register_contract(web3, address: HexAddress | bytes, instance: "Contract"):
     """Register a contract for tracing.
 
     See :py:func:`deploy_contract`.
     """
-    assert type(address) == str, f"address is {type(address)}, expected str"
     registry = get_or_create_contract_registry(web3)
-    registry[address.lower()] = instance
+    registry[get_registry_key(address)] = instance
 
 
-def get_registered_contract(web3, address: str) -> Contract:
+def get_registered_contract(web3, address: HexAddress | bytes) -> "Contract":
     """Get a contract that was deployed with the registry.
 
     - Resolve a symbolic contract information based on the contract address and our contract registry
@@ -143,11 +172,10 @@ def get_registered_contract(web3, address: str) -> Contract:
          assert contract.name == "VaultSpecificGenericAdapter"
 
     :param address:
-        Contract address as a hex string
+        Contract address as a hex string or raw bytes
 
     :return:
         The known Contract instance at the registry or `None` if the contract was not registered/deployed through registry mechanism.
     """
-    assert type(address) == str
     registry = get_or_create_contract_registry(web3)
-    return registry.get(address.lower())
+    return registry.get(get_registry_key(address))
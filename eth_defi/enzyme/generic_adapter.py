@@ -26,16 +26,16 @@ See :py:func:`eth_defi.enzyme.uniswap_v2.prepare_swap` how to use the generic ad
 
 """
 import logging
-from typing import TypeAlias, Collection, Tuple, Final
+import os
+from dataclasses import dataclass
+from typing import TypeAlias, Collection, Tuple, Final, Dict, List
 
-from eth_abi import encode
 from eth_abi.exceptions import EncodingError
+from eth_abi.registry import registry as default_abi_registry
 from eth_typing import HexAddress
 from hexbytes import HexBytes
-from web3 import Web3
 from web3.contract.contract import Contract, ContractFunction
 
-
 from eth_defi.enzyme.integration_manager import IntegrationManagerActionId
 
 ExternalCall: TypeAlias = Tuple[Contract, bytes]
@@ -45,36 +45,87 @@ Asset: TypeAlias = Contract | HexAddress
 Signer: TypeAlias = HexAddress
 
 #: See IntegrationManager.sol
-EXECUTE_CALLS_SELECTOR: Final[str] = Web3.keccak(b"executeCalls(address,bytes,bytes)")[0:4]
+#:
+#: keccak256("executeCalls(address,bytes,bytes)")[:4]
+EXECUTE_CALLS_SELECTOR: Final[bytes] = b"\xb7\xfe\x1a\x11"
+
+if __debug__ and os.getenv("ETH_DEFI_VERIFY_SELECTORS"):
+    from eth_utils import keccak
+
+    assert keccak(b"executeCalls(address,bytes,bytes)")[0:4] == EXECUTE_CALLS_SELECTOR
+
+#: ABI types of GenericAdapter external calls payload
+_EXT_CALLS_TYPES: Final[tuple] = ("address[]", "bytes[]")
+
+#: ABI types of GenericAdapter executeCalls() arguments
+_ALL_ARGS_TYPES: Final[tuple] = ("address[]", "uint256[]", "address[]", "uint256[]", "bytes")
+
+#: ABI types of IntegrationManager callOnIntegration() arguments
+_CALL_ON_INT_TYPES: Final[tuple] = ("address", "bytes4", "bytes")
+
+# Resolve the tuple encoders once at import,
+# so that eth_abi does not need to parse type strings on every encode
+_ext_calls_encoder = default_abi_registry.get_encoder(f"({','.join(_EXT_CALLS_TYPES)})")
+_all_args_encoder = default_abi_registry.get_encoder(f"({','.join(_ALL_ARGS_TYPES)})")
+_call_on_int_encoder = default_abi_registry.get_encoder(f"({','.join(_CALL_ON_INT_TYPES)})")
+
+# Static head of callOnIntegration() args for executeCalls():
+# right-padded bytes4 selector + offset of the dynamic bytes tail after the three head words
+_EXECUTE_CALLS_SELECTOR_HEAD: Final[bytes] = EXECUTE_CALLS_SELECTOR + b"\x00" * 28 + (0x60).to_bytes(32, "big")
 
 
 logger = logging.getLogger(__name__)
 
 
-def _addressify(asset: Contract | HexAddress | str):
-    assert isinstance(asset, Contract) or type(asset) == HexAddress or type(asset) == str, f"Got bad asset: {asset}"
-    if isinstance(asset, Contract):
-        return asset.address
-    return asset
+def _addressify_collection(assets: Collection[Contract | HexAddress], _Contract=Contract):
+    # Single pass without per-element function call overhead,
+    # any bad values are caught by the ABI encoder
+    return [a.address if isinstance(a, _Contract) else a for a in assets]
 
 
-def _addressify_collection(assets: Collection[Contract | HexAddress]):
-    return [_addressify(a) for a in assets]
+def encode_generic_adapter_execute_calls_args(
+    incoming_assets: Collection[Asset] | None,
+    min_incoming_asset_amounts: Collection[int],
+    spend_assets: Collection[Asset] | None,
+    spend_asset_amounts: Collection[int],
+    external_calls: Collection[ExternalCall],
+    incoming_asset_addresses: Collection[HexAddress] | None = None,
+    spend_asset_addresses: Collection[HexAddress] | None = None,
+):
+    """Encode arguments for a generic adapter call.
 
+    :param incoming_asset_addresses:
+        Pass incoming assets as already resolved hex addresses instead of `incoming_assets`
+        to skip converting contracts to addresses.
 
-def encode_generic_adapter_execute_calls_args(incoming_assets: Collection[Asset], min_incoming_asset_amounts: Collection[int], spend_assets: Collection[Asset], spend_asset_amounts: Collection[int], external_calls: Collection[ExternalCall]):
-    """Encode arguments for a generic adapter call."""
+    :param spend_asset_addresses:
+        Pass spend assets as already resolved hex addresses instead of `spend_assets`
+        to skip converting contracts to addresses.
+    """
+
+    assert (incoming_assets is None) != (incoming_asset_addresses is None), "Give either incoming_assets or incoming_asset_addresses"
+    assert (spend_assets is None) != (spend_asset_addresses is None), "Give either spend_assets or spend_asset_addresses"
+
+    if incoming_asset_addresses is None:
+        incoming_asset_addresses = _addressify_collection(incoming_assets)
+
+    if spend_asset_addresses is None:
+        spend_asset_addresses = _addressify_collection(spend_assets)
 
     #   const encodedExternalCallsData = encodeArgs(
     #     ['address[]', 'bytes[]'],
     #     [externalCallsData.contracts, externalCallsData.callsData],
     #   );
 
-    addresses = [_addressify(t[0]) for t in external_calls]
-    datas = [t[1] for t in external_calls]
+    # Split (target, data) pairs in a single pass
+    addresses = []
+    datas = []
+    for target, data in external_calls:
+        addresses.append(target.address if isinstance(target, Contract) else target)
+        datas.append(data)
 
     try:
-        encoded_external_calls_data = encode(["address[]", "bytes[]"], [addresses, datas])
+        encoded_external_calls_data = _ext_calls_encoder([addresses, datas])
     except EncodingError as e:
         raise EncodingError(f"Could not encode: {addresses} {datas}") from e
 
@@ -83,9 +134,8 @@ def encode_generic_adapter_execute_calls_args(incoming_assets: Collection[Asset]
     #     [incomingAssets, minIncomingAssetAmounts, spendAssets, spendAssetAmounts, encodedExternalCallsData],
     #   );
 
-    all_args_encoded = encode(
-        ["address[]", "uint256[]", "address[]", "uint256[]", "bytes"],
-        [_addressify_collection(incoming_assets), min_incoming_asset_amounts, _addressify_collection(spend_assets), spend_asset_amounts, encoded_external_calls_data],
+    all_args_encoded = _all_args_encoder(
+        [incoming_asset_addresses, min_incoming_asset_amounts, spend_asset_addresses, spend_asset_amounts, encoded_external_calls_data],
     )
 
     return all_args_encoded
@@ -111,12 +161,61 @@ def encode_call_on_integration_args(
 ):
     """No idea yet."""
 
+    assert isinstance(adapter, (Contract, str)), f"Got bad adapter: {adapter}"
     assert type(selector) in (bytes, HexBytes)
     assert type(encoded_call_args) in (bytes, HexBytes), f"encoded_call_args is {encoded_call_args} {type(encoded_call_args)}"
     assert len(selector) == 4, f"Selector is {selector} {type(selector)}"
     assert len(encoded_call_args) > 0
 
-    return encode(["address", "bytes4", "bytes"], [_addressify(adapter), selector, encoded_call_args])
+    adapter_address = adapter.address if isinstance(adapter, Contract) else adapter
+    return _call_on_int_encoder([adapter_address, selector, encoded_call_args])
+
+
+def _validate_execute_calls_args(
+    comptroller: Contract,
+    external_calls: Collection[ExternalCall],
+    generic_adapter: Contract,
+    integration_manager: Contract,
+):
+    """Sanity checks for :py:func:`execute_calls_for_generic_adapter`.
+
+    Not run when Python is started with `-O`.
+    """
+    assert isinstance(comptroller, Contract)
+    assert len(external_calls) > 0
+    assert isinstance(generic_adapter, Contract)
+    # assert len(incoming_assets) > 0
+    assert isinstance(integration_manager, Contract)
+    # assert len(min_incoming_asset_amounts) > 0
+    # assert len(spend_asset_amounts) > 0
+    # assert len(spend_assets) > 0
+
+
+def _encode_call_on_integration_fixed_selector(
+    adapter_address: HexAddress | str,
+    encoded_call_args: bytes,
+) -> bytes:
+    """Encode callOnIntegration() arguments for `executeCalls()`.
+
+    Same output as `encode_call_on_integration_args(adapter, EXECUTE_CALLS_SELECTOR, encoded_call_args)`,
+    but with the static ABI layout written out by hand instead of going through eth_abi:
+
+    `adapter(32) | selector(32) | offset(32) | len(32) | payload padded to 32 bytes`
+    """
+    address = bytes.fromhex(adapter_address[2:])
+    assert len(address) == 20, f"Bad adapter address: {adapter_address}"
+    payload_length = len(encoded_call_args)
+    padding = -payload_length % 32
+    return b"".join(
+        (
+            b"\x00" * 12,
+            address,
+            _EXECUTE_CALLS_SELECTOR_HEAD,
+            payload_length.to_bytes(32, "big"),
+            encoded_call_args,
+            b"\x00" * padding,
+        )
+    )
 
 
 def execute_calls_for_generic_adapter(
@@ -124,40 +223,67 @@ def execute_calls_for_generic_adapter(
     external_calls: Collection[ExternalCall],
     generic_adapter: Contract,
     integration_manager: Contract,
-    incoming_assets: Collection[Asset],
+    incoming_assets: Collection[Asset] | None,
     min_incoming_asset_amounts: Collection[int],
-    spend_assets: Collection[Asset],
+    spend_assets: Collection[Asset] | None,
     spend_asset_amounts: Collection[int],
+    incoming_asset_addresses: Collection[HexAddress] | None = None,
+    spend_asset_addresses: Collection[HexAddress] | None = None,
 ) -> ContractFunction:
     """Create a vault buy/sell transaction using a generic adapter.
 
+    :param incoming_asset_addresses:
+        Pass incoming assets as already resolved hex addresses instead of `incoming_assets`.
+
+        See :py:func:`encode_generic_adapter_execute_calls_args`.
+
+    :param spend_asset_addresses:
+        Pass spend assets as already resolved hex addresses instead of `spend_assets`.
+
+        See :py:func:`encode_generic_adapter_execute_calls_args`.
+
     :return:
         A contract function object with bound arguments
     """
 
-    logger.info("execute_calls_for_generic_adapter(): %s %s %s %s %s %s %s %s", comptroller, external_calls, generic_adapter, integration_manager, incoming_assets, min_incoming_asset_amounts, spend_assets, spend_asset_amounts)
+    assert (incoming_assets is None) != (incoming_asset_addresses is None), "Give either incoming_assets or incoming_asset_addresses"
+    assert (spend_assets is None) != (spend_asset_addresses is None), "Give either spend_assets or spend_asset_addresses"
 
-    # Sanity checks
-    assert isinstance(comptroller, Contract)
-    assert len(external_calls) > 0
-    assert isinstance(generic_adapter, Contract)
-    # assert len(incoming_assets) > 0
-    assert isinstance(integration_manager, Contract)
-    # assert len(min_incoming_asset_amounts) > 0
-    # assert len(spend_asset_amounts) > 0
-    # assert len(spend_assets) > 0
+    # Log and encode the same resolved addresses
+    if incoming_asset_addresses is None:
+        incoming_asset_addresses = _addressify_collection(incoming_assets)
+
+    if spend_asset_addresses is None:
+        spend_asset_addresses = _addressify_collection(spend_assets)
+
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "execute_calls_for_generic_adapter(): comptroller:%s external_calls:%s generic_adapter:%s integration_manager:%s incoming_assets:%s min_incoming_asset_amounts:%s spend_assets:%s spend_asset_amounts:%s",
+            comptroller.address,
+            [(c.address if isinstance(c, Contract) else c, d.hex()) for c, d in external_calls],
+            generic_adapter.address,
+            integration_manager.address,
+            incoming_asset_addresses,
+            min_incoming_asset_amounts,
+            spend_asset_addresses,
+            spend_asset_amounts,
+        )
+
+    if __debug__:
+        _validate_execute_calls_args(comptroller, external_calls, generic_adapter, integration_manager)
 
     execute_call_args = encode_generic_adapter_execute_calls_args(
-        incoming_assets=incoming_assets,
+        incoming_assets=None,
         min_incoming_asset_amounts=min_incoming_asset_amounts,
-        spend_assets=spend_assets,
+        spend_assets=None,
         spend_asset_amounts=spend_asset_amounts,
         external_calls=external_calls,
+        incoming_asset_addresses=incoming_asset_addresses,
+        spend_asset_addresses=spend_asset_addresses,
     )
 
-    call_args = encode_call_on_integration_args(
-        generic_adapter,
-        EXECUTE_CALLS_SELECTOR,
+    call_args = _encode_call_on_integration_fixed_selector(
+        generic_adapter.address,
         execute_call_args,
     )
 
@@ -165,3 +291,110 @@ def execute_calls_for_generic_adapter(
     call = comptroller.functions.callOnExtension(integration_manager.address, IntegrationManagerActionId.CallOnIntegration.value, call_args)
 
     return call
+
+
+@dataclass(slots=True, frozen=True)
+class GenericAdapterCalls:
+    """A group of GenericAdapter external calls forming one operation, like approve() + swap.
+
+    See :py:func:`execute_batched_calls_for_generic_adapter`.
+    """
+
+    #: (contract, encoded call data) pairs
+    external_calls: Collection[ExternalCall]
+
+    #: Assets the vault receives from this operation
+    incoming_assets: Collection[Asset] = ()
+
+    #: Minimum amounts of incoming assets, slippage protection
+    min_incoming_asset_amounts: Collection[int] = ()
+
+    #: Assets the vault spends in this operation
+    spend_assets: Collection[Asset] = ()
+
+    #: Amounts of spend assets
+    spend_asset_amounts: Collection[int] = ()
+
+
+def _merge_asset_amounts(assets_and_amounts: Collection[Tuple[Collection[Asset], Collection[int]]]) -> Tuple[List[HexAddress], List[int]]:
+    """Union asset lists of multiple operations.
+
+    IntegrationManager does not accept duplicate assets,
+    so amounts of the same asset are summed.
+    """
+    merged: Dict[str, int] = {}
+    addresses: Dict[str, HexAddress] = {}
+    for assets, amounts in assets_and_amounts:
+        assert len(assets) == len(amounts), f"Asset and amount count mismatch: {assets} {amounts}"
+        for asset, amount in zip(_addressify_collection(assets), amounts):
+            key = asset.lower()
+            addresses.setdefault(key, asset)
+            merged[key] = merged.get(key, 0) + amount
+    return list(addresses.values()), list(merged.values())
+
+
+def execute_batched_calls_for_generic_adapter(
+    comptroller: Contract,
+    call_groups: Collection[GenericAdapterCalls],
+    generic_adapter: Contract,
+    integration_manager: Contract,
+) -> ContractFunction:
+    """Create a single vault transaction performing multiple operations using a generic adapter.
+
+    - External calls of all groups are concatenated and executed in order within one `executeCalls()`
+
+    - Incoming and spend assets are unioned, with amounts of duplicate assets summed
+
+    - Saves signing and broadcasting a separate transaction for each operation
+
+    - An asset cannot be both spent and received within the same batch, like an intermediate token
+      of a multi-hop trade, as the vault balance change of that asset would not reflect
+      the minimum incoming amount. Use a single multi-hop call group or separate transactions instead.
+
+    Example:
+
+    .. code-block:: python
+
+        bound_call = execute_batched_calls_for_generic_adapter(
+            comptroller=comptroller,
+            call_groups=[
+                GenericAdapterCalls(external_calls=((usdc, encoded_approve),)),
+                GenericAdapterCalls(
+                    external_calls=((uniswap_v2.router, encoded_swap),),
+                    incoming_assets=[weth],
+                    min_incoming_asset_amounts=[expected_incoming_amount],
+                    spend_assets=[usdc],
+                    spend_asset_amounts=[usdc_swap_amount],
+                ),
+            ],
+            generic_adapter=generic_adapter,
+            integration_manager=deployment.contracts.integration_manager,
+        )
+
+    :param call_groups:
+        Operations to perform
+
+    :return:
+        A contract function object with bound arguments
+    """
+    assert len(call_groups) > 0, "No call groups given"
+
+    external_calls = [call for group in call_groups for call in group.external_calls]
+    incoming_asset_addresses, min_incoming_asset_amounts = _merge_asset_amounts([(g.incoming_assets, g.min_incoming_asset_amounts) for g in call_groups])
+    spend_asset_addresses, spend_asset_amounts = _merge_asset_amounts([(g.spend_assets, g.spend_asset_amounts) for g in call_groups])
+
+    overlap = {a.lower() for a in incoming_asset_addresses} & {a.lower() for a in spend_asset_addresses}
+    assert not overlap, f"Assets both spent and received in the same batch: {overlap}"
+
+    return execute_calls_for_generic_adapter(
+        comptroller=comptroller,
+        external_calls=external_calls,
+        generic_adapter=generic_adapter,
+        integration_manager=integration_manager,
+        incoming_assets=None,
+        min_incoming_asset_amounts=min_incoming_asset_amounts,
+        spend_assets=None,
+        spend_asset_amounts=spend_asset_amounts,
+        incoming_asset_addresses=incoming_asset_addresses,
+        spend_asset_addresses=spend_asset_addresses,
+    )
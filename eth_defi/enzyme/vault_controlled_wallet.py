@@ -152,11 +152,13 @@ class VaultControlledWallet:
             comptroller=vault.comptroller,
             external_calls=((tx.contract, tx.encode_payload()),),
             generic_adapter=self.generic_adapter,
-            incoming_assets=tx.incoming_assets,
+            incoming_assets=None,
+            incoming_asset_addresses=tx.incoming_assets,
             integration_manager=deployment.contracts.integration_manager,
             min_incoming_asset_amounts=tx.min_incoming_assets_amounts,
             spend_asset_amounts=tx.spend_asset_amounts,
-            spend_assets=tx.spend_assets,
+            spend_assets=None,
+            spend_asset_addresses=tx.spend_assets,
         )
 
         tx_params = {
@@ -1,7 +1,33 @@
 """Raw log event data conversion helpers."""
 from eth_typing import ChecksumAddress
+from eth_utils import keccak
 from hexbytes import HexBytes
-from web3 import Web3
+
+
+#: Masks for the high bit of each of the first 40 nibbles of a Keccak-256 digest.
+#:
+#: See :py:func:`checksum_address_bytes`.
+_CHECKSUM_NIBBLE_MASKS = tuple(1 << (255 - 4 * i) for i in range(40))
+
+
+def checksum_address_bytes(raw: bytes | HexBytes) -> ChecksumAddress:
+    """Convert raw 20 bytes address to EIP-55 checksummed address.
+
+    - Roughly 2x faster than `Web3.to_checksum_address()`, as we skip input normalisation
+      and test the digest nibbles with bit masks instead of parsing its hex string
+
+    :param raw:
+        20 bytes address
+
+    :return:
+        Checksummed Ethereum address
+    """
+    assert len(raw) == 20, f"Bad address length: {len(raw)}"
+    # HexBytes.hex() returns 0x prefixed string
+    lower = bytes(raw).hex()
+    assert len(lower) == 40, f"Bad address hex: {lower}"
+    digest = int.from_bytes(keccak(lower.encode("ascii")), "big")
+    return ChecksumAddress("0x" + "".join([c.upper() if digest & mask else c for c, mask in zip(lower, _CHECKSUM_NIBBLE_MASKS)]))
 
 
 def decode_data(data: str) -> list[bytes]:
@@ -31,7 +57,7 @@ def convert_uint256_bytes_to_address(raw: bytes | HexBytes) -> ChecksumAddress:
     """
     assert type(raw) in (bytes, HexBytes), f"Received: {type(raw)}"
     assert len(raw) == 32
-    return Web3.to_checksum_address(raw[12:])
+    return checksum_address_bytes(raw[12:])
 
 
 def convert_uint256_hex_string_to_address(hex: str) -> ChecksumAddress:
@@ -46,7 +72,7 @@ def convert_uint256_hex_string_to_address(hex: str) -> ChecksumAddress:
     assert type(hex) == str, f"Received: {type(hex)}"
     raw = HexBytes(hex)
     assert len(raw) == 32
-    return Web3.to_checksum_address(raw[12:])
+    return checksum_address_bytes(raw[12:])
 
 
 def convert_int256_bytes_to_int(bytes32: bytes, *, signed: bool = False) -> int:
@@ -72,7 +98,7 @@ def convert_uint256_string_to_address(bytes32: str) -> ChecksumAddress:
     assert bytes32.startswith("0x")
     raw = bytes.fromhex(bytes32[2:])
     assert len(raw) == 32
-    return Web3.to_checksum_address(raw[12:])
+    return checksum_address_bytes(raw[12:])
 
 
 def convert_uint256_string_to_int(bytes32: str, *, signed: bool = False) -> int:
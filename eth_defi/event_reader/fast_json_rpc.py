@@ -1,16 +1,19 @@
 """JSON-RPC decoding optimised for web3.py.
 
-Monkey-patches JSON decoder to use ujson.
+- Monkey-patches JSON decoder to use ujson.
+
+- Pipeline multiple JSON-RPC requests over a single HTTP POST with :py:class:`JSONRPCBatch`.
 """
 
 import logging
 from json import JSONDecodeError
 
-from typing import cast
+from typing import cast, Any, List, Optional, Tuple
 
 import ujson
 
-from web3 import Web3
+from web3 import Web3, HTTPProvider
+from web3._utils.request import make_post_request
 from web3.providers import JSONBaseProvider
 from web3.types import RPCResponse
 
@@ -50,3 +53,101 @@ def patch_web3(web3: Web3):
     multiple and large responses.
     """
     patch_provider(web3.provider)
+
+
+class JSONRPCBatch:
+    """Pipeline multiple JSON-RPC requests over a single HTTP POST.
+
+    - Requests are queued with :py:meth:`add` and sent when :py:meth:`execute` is called
+
+    - Each HTTP POST carries at most `batch_size` requests,
+      saving a HTTP round trip per request
+
+    - Params must be in JSON-RPC wire format (hex strings)
+
+    - Results are raw JSON-RPC results: web3.py middlewares and result formatters are not applied
+
+    Example:
+
+    .. code-block:: python
+
+        batch = JSONRPCBatch(web3)
+        for block_number in range(start_block, end_block):
+            batch.add("eth_getBlockByNumber", [hex(block_number), False])
+        blocks = batch.execute()
+
+    See also :py:meth:`eth_defi.event_reader.web3factory.TunedWeb3Factory.batch`.
+    """
+
+    def __init__(self, web3: Web3, batch_size=50):
+        """Create a new batch.
+
+        :param web3:
+            Web3 connection using :py:class:`web3.HTTPProvider`
+
+        :param batch_size:
+            Max number of JSON-RPC requests per HTTP POST
+        """
+        assert isinstance(web3.provider, HTTPProvider), f"JSON-RPC batching needs HTTPProvider, got {web3.provider}"
+        assert batch_size > 0
+        self.provider: HTTPProvider = web3.provider
+        self.batch_size = batch_size
+        self.pending: List[Tuple[str, list]] = []
+
+        #: Results of the last :py:meth:`execute`
+        self.results: Optional[List[Any]] = None
+
+    def __len__(self):
+        return len(self.pending)
+
+    def add(self, method: str, params: Optional[list] = None) -> int:
+        """Queue a JSON-RPC request.
+
+        :param method:
+            JSON-RPC method name like `eth_call`
+
+        :param params:
+            JSON-RPC params
+
+        :return:
+            Index of the result in the list returned by :py:meth:`execute`
+        """
+        self.pending.append((method, params or []))
+        return len(self.pending) - 1
+
+    def execute(self) -> List[Any]:
+        """Send all queued requests.
+
+        :return:
+            JSON-RPC results in the order the requests were added
+
+        :raise ValueError:
+            If any of the requests returned a JSON-RPC error
+        """
+        pending = self.pending
+        self.pending = []
+        results = []
+        request_kwargs = self.provider.get_request_kwargs()
+
+        for start in range(0, len(pending), self.batch_size):
+            chunk = pending[start : start + self.batch_size]
+            payload = [{"jsonrpc": "2.0", "method": method, "params": params, "id": idx} for idx, (method, params) in enumerate(chunk)]
+            raw_response = make_post_request(self.provider.endpoint_uri, ujson.dumps(payload).encode("utf-8"), **request_kwargs)
+            responses = self.provider.decode_rpc_response(raw_response)
+
+            if not isinstance(responses, list):
+                # Node does not support batching and returned a single error
+                raise ValueError(responses.get("error", responses))
+
+            # The JSON-RPC spec allows responses in any order
+            responses_by_id = {r.get("id"): r for r in responses}
+            for idx, (method, params) in enumerate(chunk):
+                response = responses_by_id.get(idx)
+                if response is None:
+                    raise ValueError(f"No response for batched {method}({params})")
+                if "error" in response:
+                    raise ValueError(response["error"])
+                results.append(response["result"])
+
+        self.results = results
+        return results
@@ -2,20 +2,31 @@
 
 Methods for creating Web3 connections over multiple threads and processes.
 """
-from collections import Counter
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
 from threading import local
-from typing import Protocol, Optional, Any, Dict, List
+from typing import Protocol, Optional, Any, Dict, List, Iterator, TYPE_CHECKING
 
-import requests
-from requests.adapters import HTTPAdapter
-from web3 import HTTPProvider, Web3
+if TYPE_CHECKING:
+    # HTTP and web3 machinery is heavy to import,
+    # so we import them only when creating connections
+    import requests
+    from requests.adapters import HTTPAdapter
+    from web3 import Web3
 
-from eth_defi.chain import install_chain_middleware, install_retry_middleware, install_api_call_counter_middleware
-from eth_defi.event_reader.fast_json_rpc import patch_web3
+    from eth_defi.event_reader.fast_json_rpc import JSONRPCBatch
 
 
+#: Per-thread cached Web3 connections.
+#:
+#: `by_url` attribute is an :py:class:`OrderedDict` of JSON-RPC URL -> Web3 connection
+#: in least recently used order.
 _web3_thread_local_cache = local()
 
+#: How many different JSON-RPC URLs a thread caches Web3 connections for
+#: before the least recently used one is evicted
+WEB3_THREAD_LOCAL_CACHE_MAX_URLS = 16
+
 
 class Web3Factory(Protocol):
     """Create a new Web3 connection.
@@ -29,7 +40,7 @@ class Web3Factory(Protocol):
     `See Python documentation regarding typing.Protocol <https://stackoverflow.com/questions/68472236/type-hint-for-callable-that-takes-kwargs>`__.
     """
 
-    def __call__(self, context: Optional[Any] = None) -> Web3:
+    def __call__(self, context: Optional[Any] = None) -> "Web3":
         """Create a new Web3 connection.
 
         :param context:
@@ -56,7 +67,7 @@ class TunedWeb3Factory(Web3Factory):
     def __init__(
         self,
         json_rpc_url: str,
-        http_adapter: Optional[HTTPAdapter] = None,
+        http_adapter: Optional["HTTPAdapter"] = None,
         thread_local_cache=False,
         api_counter=False,
     ):
@@ -72,10 +83,18 @@ class TunedWeb3Factory(Web3Factory):
             Default to pool size 10.
 
         :param thread_local_cache:
-            Construct the web3 connection only once per thread.
+            Construct the web3 connection only once per thread and JSON-RPC URL.
 
             If you are using thread pooling, recycles the connection
-            across different factory calls.
+            across different factory calls. Factories for different
+            JSON-RPC URLs, e.g. multiple chains, each get their own connection.
+            See :py:data:`WEB3_THREAD_LOCAL_CACHE_MAX_URLS`.
+
+            asyncio tasks running on the same event loop thread
+            share the same cached connection.
+            We deliberately do not cache in a `ContextVar`, as `asyncio.to_thread()`
+            copies the context to worker threads and a Web3 connection would leak
+            across thread boundaries.
 
         :param api_counter:
             Enable API counters
@@ -84,6 +103,8 @@ class TunedWeb3Factory(Web3Factory):
         self.json_rpc_url = json_rpc_url
 
         if not http_adapter:
+            from requests.adapters import HTTPAdapter
+
             http_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10)
 
         self.http_adapter = http_adapter
@@ -95,34 +116,46 @@ class TunedWeb3Factory(Web3Factory):
         else:
             self.api_counters = None
 
-    def __call__(self, context: Optional[Any] = None) -> Web3:
+    def __call__(self, context: Optional[Any] = None) -> "Web3":
         """Create a new Web3 connection.
 
         - Get rid of middleware
 
         - Patch for ujson
         """
+        from web3 import HTTPProvider, Web3
+
+        from eth_defi.chain import install_chain_middleware, install_retry_middleware, install_api_call_counter_middleware
+        from eth_defi.event_reader.fast_json_rpc import patch_provider
 
         if self.thread_local_cache:
-            web3 = getattr(_web3_thread_local_cache, "web3", None)
+            cache = getattr(_web3_thread_local_cache, "by_url", None)
+            if cache is None:
+                cache = _web3_thread_local_cache.by_url = OrderedDict()
+
+            web3 = cache.get(self.json_rpc_url)
             if web3 is not None:
+                cache.move_to_end(self.json_rpc_url)
                 return web3
 
-        # Reuse HTTPS session for HTTP 1.1 keep-alive
-        session = requests.Session()
-        session.mount("https://", self.http_adapter)
-
-        web3 = Web3(HTTPProvider(self.json_rpc_url, session=session))
+        # requests.Session is not thread safe, so each connection gets its own session.
+        # Sessions share the thread safe connection pool of our HTTP adapter,
+        # so HTTP 1.1 keep-alive connections are still reused across factory calls.
+        provider = HTTPProvider(self.json_rpc_url, session=self._create_session())
 
         # Enable faster ujson reads
-        patch_web3(web3)
+        patch_provider(provider)
+
+        web3 = Web3(provider)
 
         web3.middleware_onion.clear()
         install_chain_middleware(web3)
         install_retry_middleware(web3)
 
         if self.thread_local_cache:
-            _web3_thread_local_cache.web3 = web3
+            cache[self.json_rpc_url] = web3
+            if len(cache) > WEB3_THREAD_LOCAL_CACHE_MAX_URLS:
+                cache.popitem(last=False)
 
         if self.api_counters is not None:
             counter = install_api_call_counter_middleware(web3)
@@ -130,6 +163,51 @@ class TunedWeb3Factory(Web3Factory):
 
         return web3
 
+    def create_batched(self, batch_size=50) -> "JSONRPCBatch":
+        """Create a JSON-RPC batch over a connection from this factory.
+
+        :param batch_size:
+            Max number of JSON-RPC requests per HTTP POST
+
+        :return:
+            An empty batch. Call :py:meth:`JSONRPCBatch.execute` to send the queued requests.
+        """
+        from eth_defi.event_reader.fast_json_rpc import JSONRPCBatch
+
+        return JSONRPCBatch(self(), batch_size=batch_size)
+
+    @contextmanager
+    def batch(self, batch_size=50) -> Iterator["JSONRPCBatch"]:
+        """Pipeline JSON-RPC requests issued within a context.
+
+        Queued requests are sent when the context exits.
+
+        Example:
+
+        .. code-block:: python
+
+            with web3_factory.batch() as batch:
+                for block_number in range(start_block, end_block):
+                    batch.add("eth_getBlockByNumber", [hex(block_number), False])
+
+            blocks = batch.results
+
+        :param batch_size:
+            Max number of JSON-RPC requests per HTTP POST
+        """
+        batch = self.create_batched(batch_size)
+        yield batch
+        batch.execute()
+
+    def _create_session(self) -> "requests.Session":
+        """Create a HTTP session using our connection pool."""
+        import requests
+
+        session = requests.Session()
+        session.mount("https://", self.http_adapter)
+        session.mount("http://", self.http_adapter)
+        return session
+
     def get_total_api_call_counts(self) -> Counter:
         """Sum API call counts across all threads"""
         assert len(self.api_counters) > 0, "No API count enabled"
@@ -146,8 +224,8 @@ class SimpleWeb3Factory:
     - Useful for testing
     """
 
-    def __init__(self, web3: Web3):
+    def __init__(self, web3: "Web3"):
         self.web3 = web3
 
-    def __call__(self, context: Optional[Any] = None) -> Web3:
+    def __call__(self, context: Optional[Any] = None) -> "Web3":
         return self.web3
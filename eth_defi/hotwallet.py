@@ -18,8 +18,6 @@ from hexbytes import HexBytes
 from web3 import Web3
 from web3.contract.contract import ContractFunction
 
-from eth_defi.tx import decode_signed_transaction
-
 
 logger = logging.getLogger(__name__)
 
@@ -127,7 +125,6 @@ class HotWallet:
         assert "nonce" not in tx
         tx["nonce"] = self.allocate_nonce()
         _signed = self.account.sign_transaction(tx)
-        decode_signed_transaction(_signed.rawTransaction)
         signed = SignedTransactionWithNonce(
             rawTransaction=_signed.rawTransaction,
             hash=_signed.hash,
@@ -0,0 +1,114 @@
+"""Multicall read aggregation.
+
+Perform multiple smart contract reads in a single `eth_call` JSON-RPC round trip
+using `Multicall3 <https://github.com/mds1/multicall>`__.
+
+- Multicall3 is deployed at the same address on most EVM chains, see :py:data:`MULTICALL3_ADDRESS`
+
+- We call `tryAggregate()` that Multicall3 retains for backwards compatibility,
+  so the same code works against `Multicall2` deployments, like the one
+  bundled in `sushi/Multicall2.json` for test chains
+
+Example:
+
+.. code-block:: python
+
+    from eth_defi.multicall import multicall3_aggregate
+
+    balance, allowance = multicall3_aggregate(
+        web3,
+        [
+            (usdc, "balanceOf", (vault.address,)),
+            (usdc, "allowance", (vault.address, router.address)),
+        ],
+    )
+
+"""
+import os
+from typing import Any, Collection, Final, List, Tuple, TypeAlias
+
+from eth_abi import decode
+from eth_abi.registry import registry as default_abi_registry
+from eth_typing import HexAddress, BlockIdentifier
+from web3 import Web3
+from web3._utils.abi import get_abi_output_types
+from web3.contract.contract import Contract
+
+from eth_defi.abi import encode_function_call
+
+#: Multicall3 address on Ethereum mainnet and most other EVM chains
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+#: Contract, function name, function args
+MulticallRead: TypeAlias = Tuple[Contract, str, Collection[Any]]
+
+#: See Multicall3.sol
+#:
+#: keccak256("tryAggregate(bool,(address,bytes)[])")[:4]
+TRY_AGGREGATE_SELECTOR: Final[bytes] = b"\xbc\xe3\x8b\xd7"
+
+if __debug__ and os.getenv("ETH_DEFI_VERIFY_SELECTORS"):
+    from eth_utils import keccak
+
+    assert keccak(b"tryAggregate(bool,(address,bytes)[])")[0:4] == TRY_AGGREGATE_SELECTOR
+
+# Resolve the tuple encoder once at import
+_try_aggregate_args_encoder = default_abi_registry.get_encoder("(bool,(address,bytes)[])")
+
+
+def multicall3_aggregate(
+    web3: Web3,
+    calls: Collection[MulticallRead],
+    multicall_address: HexAddress | str = MULTICALL3_ADDRESS,
+    block_identifier: BlockIdentifier = "latest",
+) -> List[Any]:
+    """Perform multiple smart contract reads in a single `eth_call`.
+
+    :param web3:
+        Web3 connection
+
+    :param calls:
+        List of (contract, function name, args) tuples
+
+    :param multicall_address:
+        Address of the deployed Multicall3 (or Multicall2) contract
+
+    :param block_identifier:
+        Block number or tag to read at
+
+    :return:
+        Decoded return values in the order of the calls.
+
+        Functions with a single return value are unwrapped from the result tuple.
+
+    :raise Exception:
+        If any of the calls reverts, the whole `eth_call` reverts.
+        The exception type depends on the web3 provider:
+
+        - `web3.exceptions.ContractLogicError` for JSON-RPC nodes
+
+        - `eth_tester.exceptions.TransactionFailed` for `EthereumTesterProvider`
+    """
+    assert len(calls) > 0, "No calls given"
+
+    functions = []
+    call_tuples = []
+    for contract, fn_name, args in calls:
+        func = contract.functions[fn_name](*args)
+        functions.append(func)
+        call_tuples.append((contract.address, encode_function_call(func, args)))
+
+    data = TRY_AGGREGATE_SELECTOR + _try_aggregate_args_encoder([True, call_tuples])
+    raw_result = web3.eth.call({"to": multicall_address, "data": data}, block_identifier)
+
+    # With requireSuccess=True any failed call reverts the whole eth_call,
+    # so all results here are successful
+    (results,) = decode(["(bool,bytes)[]"], raw_result)
+
+    decoded = []
+    for func, (_, return_data) in zip(functions, results):
+        output_types = get_abi_output_types(func.abi)
+        values = decode(output_types, return_data)
+        decoded.append(values[0] if len(values) == 1 else values)
+
+    return decoded
@@ -397,7 +397,9 @@ class SymbolicTreeRepresentation:
             # Ignore checksumming if user does not have eth-hash backend installed.
             address = cast(ChecksumAddress, address_hex_str)
 
-        contract = self.contract_registry.get(address.lower())
+        # Registry is keyed by raw address bytes, see get_registry_key().
+        # Do not validate here, as this is used to explain failed transactions.
+        contract = self.contract_registry.get(bytes(self.call.address)) if self.call.address else None
 
         function_selector = self.call.calldata[:4]
 
@@ -9,7 +9,7 @@ from web3.contract import Contract
 from eth_defi.abi import encode_function_args, encode_function_call
 from eth_defi.deploy import deploy_contract, get_or_create_contract_registry
 from eth_defi.enzyme.deployment import EnzymeDeployment, RateAsset
-from eth_defi.enzyme.generic_adapter import execute_calls_for_generic_adapter
+from eth_defi.enzyme.generic_adapter import encode_generic_adapter_execute_calls_args, execute_calls_for_generic_adapter, execute_batched_calls_for_generic_adapter, GenericAdapterCalls, encode_call_on_integration_args, EXECUTE_CALLS_SELECTOR, _encode_call_on_integration_fixed_selector
 from eth_defi.enzyme.vault import Vault
 from eth_defi.trace import trace_evm_transaction, print_symbolic_trace, assert_transaction_success_with_explanation
 from eth_defi.uniswap_v2.deployment import UniswapV2Deployment
@@ -220,6 +220,129 @@ def test_generic_adapter_approve(
     assert usdc.functions.allowance(generic_adapter.address, uniswap_v2.router.address).call() == approve_amount
 
 
+def test_generic_adapter_batched_calls(
+    web3: Web3,
+    deployer: HexAddress,
+    user_1: HexAddress,
+    user_2,
+    weth: Contract,
+    usdc: Contract,
+    dual_token_deployment: EnzymeDeployment,
+    uniswap_v2: UniswapV2Deployment,
+    weth_usdc_pair: Contract,
+):
+    """Perform approve() and swap as separate operations in a single vault transaction."""
+
+    deployment = dual_token_deployment
+
+    comptroller, vault = deployment.create_new_vault(
+        user_1,
+        usdc,
+    )
+
+    generic_adapter = deploy_contract(
+        web3,
+        f"VaultSpecificGenericAdapter.json",
+        deployer,
+        deployment.contracts.integration_manager.address,
+        vault.address,
+    )
+
+    usdc.functions.transfer(user_2, 500 * 10**6).transact({"from": deployer})
+    usdc.functions.approve(comptroller.address, 500 * 10**6).transact({"from": user_2})
+    comptroller.functions.buyShares(500 * 10**6, 1).transact({"from": user_2})
+
+    usdc_swap_amount = 150 * 10**6
+    path = [usdc.address, weth.address]
+    expected_outgoing_amount, expected_incoming_amount = uniswap_v2.router.functions.getAmountsOut(usdc_swap_amount, path).call()
+
+    encoded_approve = encode_function_call(usdc.functions.approve, [uniswap_v2.router.address, usdc_swap_amount])
+    encoded_swapExactTokensForTokens = encode_function_call(uniswap_v2.router.functions.swapExactTokensForTokens, [usdc_swap_amount, 1, path, generic_adapter.address, FOREVER_DEADLINE])
+
+    bound_call = execute_batched_calls_for_generic_adapter(
+        comptroller=comptroller,
+        call_groups=[
+            GenericAdapterCalls(external_calls=((usdc, encoded_approve),)),
+            GenericAdapterCalls(
+                external_calls=((uniswap_v2.router, encoded_swapExactTokensForTokens),),
+                incoming_assets=[weth],
+                min_incoming_asset_amounts=[expected_incoming_amount],
+                spend_assets=[usdc],
+                spend_asset_amounts=[usdc_swap_amount],
+            ),
+        ],
+        generic_adapter=generic_adapter,
+        integration_manager=deployment.contracts.integration_manager,
+    )
+
+    tx_hash = bound_call.transact({"from": user_1, "gas": 1_000_000})
+    assert_transaction_success_with_explanation(web3, tx_hash)
+
+    assert weth.functions.balanceOf(vault.address).call() == pytest.approx(93398910964326424)
+    assert usdc.functions.balanceOf(vault.address).call() == 350 * 10**6
+
+
+def test_generic_adapter_batched_calls_overlapping_assets():
+    """Batch cannot both spend and receive the same asset."""
+
+    usdc = "0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174"
+    weth = "0x7ceB23fD6bC0adD59E62ac25578270cFf1b9f619"
+    dai = "0x8f3Cf7ad23Cd3CaDbD9735AFf958023239c6A063"
+
+    with pytest.raises(AssertionError, match="both spent and received"):
+        execute_batched_calls_for_generic_adapter(
+            comptroller=None,
+            call_groups=[
+                GenericAdapterCalls(
+                    external_calls=((usdc, b"\x01"),),
+                    incoming_assets=[weth],
+                    min_incoming_asset_amounts=[1],
+                    spend_assets=[usdc],
+                    spend_asset_amounts=[1],
+                ),
+                GenericAdapterCalls(
+                    external_calls=((weth, b"\x02"),),
+                    incoming_assets=[dai],
+                    min_incoming_asset_amounts=[1],
+                    spend_assets=[weth.lower()],
+                    spend_asset_amounts=[1],
+                ),
+            ],
+            generic_adapter=None,
+            integration_manager=None,
+        )
+
+
+@pytest.mark.parametrize("payload_length", [1, 31, 32, 33, 64])
+def test_encode_call_on_integration_fixed_selector(payload_length: int):
+    """Hand-written executeCalls() args encoding matches eth_abi."""
+    adapter = "0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAed"
+    payload = bytes(range(1, payload_length + 1))
+    assert _encode_call_on_integration_fixed_selector(adapter, payload) == encode_call_on_integration_args(adapter, EXECUTE_CALLS_SELECTOR, payload)
+
+
+def test_encode_generic_adapter_execute_calls_args_asset_addresses():
+    """Assets are given either as contracts or resolved addresses, not both."""
+    usdc = "0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174"
+
+    encoded = encode_generic_adapter_execute_calls_args(
+        incoming_assets=None,
+        min_incoming_asset_amounts=[],
+        spend_assets=None,
+        spend_asset_amounts=[1],
+        external_calls=((usdc, b"\x01"),),
+        incoming_asset_addresses=[],
+        spend_asset_addresses=[usdc],
+    )
+    assert encoded == encode_generic_adapter_execute_calls_args([], [], [usdc], [1], ((usdc, b"\x01"),))
+
+    with pytest.raises(AssertionError, match="incoming_asset_addresses"):
+        encode_generic_adapter_execute_calls_args(None, [], [usdc], [1], ((usdc, b"\x01"),))
+
+    with pytest.raises(AssertionError, match="spend_asset_addresses"):
+        encode_generic_adapter_execute_calls_args([], [], [usdc], [1], ((usdc, b"\x01"),), spend_asset_addresses=[usdc])
+
+
 def test_fetch_vault_with_generic_adapter(
     web3: Web3,
     deployer: HexAddress,
@@ -19,6 +19,7 @@ from eth_defi.enzyme.vault_controlled_wallet import (
     VaultControlledWallet,
 )
 from eth_defi.hotwallet import HotWallet
+from eth_defi.multicall import multicall3_aggregate
 from eth_defi.revert_reason import fetch_transaction_revert_reason
 from eth_defi.trace import assert_transaction_success_with_explanation
 from eth_defi.trade import TradeSuccess
@@ -92,6 +93,12 @@ def deployment(
     return deployment
 
 
+@pytest.fixture
+def multicall(web3: Web3, deployer: HexAddress) -> Contract:
+    """Multicall2 is API compatible with Multicall3 tryAggregate()."""
+    return deploy_contract(web3, "sushi/Multicall2.json", deployer)
+
+
 def test_asset_delta_mul(usdc: Contract):
     """Check that the asset delta multiplier works."""
 
@@ -147,6 +154,7 @@ def test_vault_controlled_wallet_make_buy(
     weth: Contract,
     user_1: HexAddress,
     weth_usdc_pair: Contract,
+    multicall: Contract,
 ):
     """Buy tokens using vault controlled wallet interface."""
 
@@ -185,16 +193,27 @@ def test_vault_controlled_wallet_make_buy(
     tx_hash = web3.eth.send_raw_transaction(signed.raw_transaction)
     assert_transaction_success_with_explanation(web3, tx_hash)
 
-    # Vault can now trade on Uniswap v2.
-    # TODO: This exposes the unsafetiness of the default GenericAdapter implementation
-    assert usdc.functions.allowance(vault.generic_adapter.address, uniswap_v2.router.address).call() > 0
-
     # Prepare the swap parameters
     token_in = usdc
     token_out = weth
     token_in_swap_amount = swap_amount
     path = [token_in.address, token_out.address]
-    token_in_amount, token_out_amount = uniswap_v2.router.functions.getAmountsOut(token_in_swap_amount, path).call()
+
+    # Do pre-swap reads in a single eth_call
+    allowance, vault_balance, (token_in_amount, token_out_amount) = multicall3_aggregate(
+        web3,
+        [
+            (usdc, "allowance", (vault.generic_adapter.address, uniswap_v2.router.address)),
+            (usdc, "balanceOf", (vault.address,)),
+            (uniswap_v2.router, "getAmountsOut", (token_in_swap_amount, path)),
+        ],
+        multicall_address=multicall.address,
+    )
+
+    # Vault can now trade on Uniswap v2.
+    # TODO: This exposes the unsafetiness of the default GenericAdapter implementation
+    assert allowance > 0
+    assert vault_balance == swap_amount
 
     assert token_in_amount / 10**6 == 500
     assert token_out_amount / 10**18 == pytest.approx(0.31078786125581986)  # 1600 ETH/USD
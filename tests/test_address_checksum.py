@@ -0,0 +1,27 @@
+"""Fast EIP-55 address checksum."""
+import os
+
+from hexbytes import HexBytes
+from web3 import Web3
+
+from eth_defi.event_reader.conversion import checksum_address_bytes, convert_uint256_bytes_to_address
+
+
+def test_checksum_address_bytes():
+    """Fast checksum matches web3 for random addresses."""
+    for i in range(200):
+        raw = os.urandom(20)
+        assert checksum_address_bytes(raw) == Web3.to_checksum_address(raw)
+
+
+def test_convert_uint256_bytes_to_address():
+    """Log topic padded address is checksummed."""
+    raw = bytes(12) + bytes.fromhex("5aaeb6053f3e94c9b9a09f33669435e7ef1beaed")
+    assert convert_uint256_bytes_to_address(raw) == "0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAed"
+
+
+def test_checksum_address_hexbytes():
+    """HexBytes input, as passed by the event decoders, is checksummed."""
+    raw = HexBytes(bytes(12) + bytes.fromhex("5aaeb6053f3e94c9b9a09f33669435e7ef1beaed"))
+    assert checksum_address_bytes(raw[12:]) == "0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAed"
+    assert convert_uint256_bytes_to_address(raw) == "0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAed"
@@ -0,0 +1,39 @@
+"""JSON-RPC batching tests."""
+import pytest
+
+from eth_defi.anvil import launch_anvil, AnvilLaunch
+from eth_defi.event_reader.web3factory import TunedWeb3Factory
+
+
+@pytest.fixture(scope="module")
+def anvil() -> AnvilLaunch:
+    """Launch Anvil for the test backend."""
+    anvil = launch_anvil()
+    try:
+        yield anvil
+    finally:
+        anvil.close()
+
+
+def test_json_rpc_batch(anvil: AnvilLaunch):
+    """Send multiple JSON-RPC requests in batches."""
+    web3_factory = TunedWeb3Factory(anvil.json_rpc_url)
+
+    with web3_factory.batch(batch_size=2) as batch:
+        for i in range(3):
+            batch.add("eth_chainId")
+        batch.add("eth_getBlockByNumber", ["latest", False])
+
+    assert len(batch) == 0
+    assert batch.results[0:3] == ["0x7a69"] * 3
+    assert batch.results[3]["number"] == "0x0"
+
+
+def test_json_rpc_batch_error(anvil: AnvilLaunch):
+    """JSON-RPC error in a batch is raised."""
+    web3_factory = TunedWeb3Factory(anvil.json_rpc_url)
+    batch = web3_factory.create_batched()
+    batch.add("eth_chainId")
+    batch.add("eth_foobar")
+    with pytest.raises(ValueError):
+        batch.execute()
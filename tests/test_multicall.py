@@ -0,0 +1,74 @@
+"""Multicall read aggregation."""
+
+import pytest
+
+from eth_tester.exceptions import TransactionFailed
+from web3 import Web3, EthereumTesterProvider
+from web3.contract import Contract
+
+from eth_defi.deploy import deploy_contract
+from eth_defi.multicall import multicall3_aggregate
+from eth_defi.token import create_token
+
+
+@pytest.fixture
+def web3():
+    """Set up a local unit testing blockchain."""
+    # https://web3py.readthedocs.io/en/stable/examples.html#contract-unit-tests-in-python
+    return Web3(EthereumTesterProvider())
+
+
+@pytest.fixture()
+def deployer(web3) -> str:
+    """Deploy account."""
+    return web3.eth.accounts[0]
+
+
+@pytest.fixture()
+def user_1(web3) -> str:
+    """User account."""
+    return web3.eth.accounts[1]
+
+
+@pytest.fixture()
+def multicall(web3, deployer) -> Contract:
+    """Multicall2 is API compatible with Multicall3 tryAggregate()."""
+    return deploy_contract(web3, "sushi/Multicall2.json", deployer)
+
+
+def test_multicall_aggregate(web3: Web3, deployer: str, user_1: str, multicall: Contract):
+    """Read multiple values in a single eth_call."""
+    token = create_token(web3, deployer, "Hentai books token", "HENTAI", 100_000 * 10**18, 6)
+    token.functions.approve(user_1, 500).transact({"from": deployer})
+
+    balance, allowance, symbol = multicall3_aggregate(
+        web3,
+        [
+            (token, "balanceOf", (deployer,)),
+            (token, "allowance", (deployer, user_1)),
+            (token, "symbol", ()),
+        ],
+        multicall_address=multicall.address,
+    )
+
+    assert balance == 100_000 * 10**18
+    assert allowance == 500
+    assert symbol == "HENTAI"
+
+
+def test_multicall_aggregate_revert(web3: Web3, deployer: str, multicall: Contract):
+    """Any failed call reverts the aggregate."""
+    token = create_token(web3, deployer, "Hentai books token", "HENTAI", 100_000 * 10**18, 6)
+
+    # Multicall2 itself does not have ERC-20 functions
+    not_a_token = web3.eth.contract(address=multicall.address, abi=token.abi)
+
+    with pytest.raises(TransactionFailed):
+        multicall3_aggregate(
+            web3,
+            [
+                (token, "balanceOf", (deployer,)),
+                (not_a_token, "symbol", ()),
+            ],
+            multicall_address=multicall.address,
+        )
@@ -3,6 +3,7 @@
 import pytest
 
 from eth_tester.exceptions import TransactionFailed
+from hexbytes import HexBytes
 from web3 import Web3, EthereumTesterProvider
 
 from eth_defi.deploy import deploy_contract, get_registered_contract
@@ -66,6 +67,11 @@ def test_deploy_token(web3: Web3, deployer: str):
 
     registered_contract = get_registered_contract(web3, token.address)
     assert registered_contract.name == "ERC20MockDecimals"
+    assert get_registered_contract(web3, token.address.lower()) is registered_contract
+    assert get_registered_contract(web3, HexBytes(token.address)) is registered_contract
+
+    with pytest.raises(AssertionError):
+        get_registered_contract(web3, token.address[2:])
 
 
 def test_tranfer_tokens_between_users(web3: Web3, deployer: str, user_1, user_2):
@@ -0,0 +1,50 @@
+"""Web3 connection factory caching."""
+import pytest
+
+from eth_defi.anvil import launch_anvil, AnvilLaunch
+from eth_defi.event_reader import web3factory
+from eth_defi.event_reader.web3factory import TunedWeb3Factory
+
+
+@pytest.fixture(scope="module")
+def anvil() -> AnvilLaunch:
+    """Launch Anvil for the test backend."""
+    anvil = launch_anvil()
+    try:
+        yield anvil
+    finally:
+        anvil.close()
+
+
+@pytest.fixture()
+def json_rpc_urls(anvil: AnvilLaunch) -> list[str]:
+    """Different JSON-RPC URLs pointing to the same node."""
+    port = anvil.json_rpc_url.rsplit(":", 1)[-1]
+    return [f"http://localhost:{port}", f"http://127.0.0.1:{port}", f"http://127.0.0.1:{port}/"]
+
+
+def test_thread_local_cache_per_url(json_rpc_urls: list[str]):
+    """Factories for different JSON-RPC URLs get their own cached connection."""
+    factory_1 = TunedWeb3Factory(json_rpc_urls[0], thread_local_cache=True)
+    factory_2 = TunedWeb3Factory(json_rpc_urls[1], thread_local_cache=True)
+
+    web3_1 = factory_1()
+    web3_2 = factory_2()
+    assert web3_1 is not web3_2
+    assert factory_1() is web3_1
+    assert factory_2() is web3_2
+
+
+def test_thread_local_cache_eviction(monkeypatch, json_rpc_urls: list[str]):
+    """Least recently used connection is evicted."""
+    monkeypatch.setattr(web3factory, "WEB3_THREAD_LOCAL_CACHE_MAX_URLS", 2)
+
+    factory_1, factory_2, factory_3 = [TunedWeb3Factory(url, thread_local_cache=True) for url in json_rpc_urls]
+
+    web3_1 = factory_1()
+    web3_2 = factory_2()
+    assert factory_1() is web3_1  # factory_2 is now least recently used
+    factory_3()
+
+    assert factory_1() is web3_1
+    assert factory_2() is not web3_2